@@ -13,11 +13,15 @@ and start a server like this:
 tiled serve config config.yml
 """
 
+import bisect
 import os
+import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import xraydb
 from tiled.adapters.dataframe import DataFrameAdapter
@@ -28,8 +32,86 @@ _EDGE_ENERGY_DICT = {
     xraydb.atomic_symbol(i): [i, xraydb.xray_edges(i)] for i in range(1, 99)
 }
 
+# Prefix shared by every object-cache key this module creates; computed
+# once instead of on every cached file.
+_CACHE_KEY_PREFIX = Path(__file__).stem
+
+
+def _element_edge_candidates(element, values):
+    # Most of the cases are solved with a 'K' edge value; an element with
+    # one only ever matches on it. The rest keep their edges in xraydb
+    # order so the first in-range edge wins.
+    number, edges = values
+    if "K" in edges:
+        candidates = (("K", edges["K"].energy),)
+    else:
+        candidates = tuple((key, edge.energy) for key, edge in edges.items())
+    return element, number, candidates
+
+
+# Flattened edge energies per element, extracted from the xraydb records
+# once at import time so parse_element_name does not repeat the nested
+# dict and attribute lookups for every file.
+_EDGE_CANDIDATES = [
+    _element_edge_candidates(element, values)
+    for element, values in _EDGE_ENERGY_DICT.items()
+]
+
+# The same candidates sorted by energy, so the per-file range scan is a
+# bisect window into this index instead of a pass over every element.
+# Each entry keeps the element and edge-order positions needed to
+# reconstruct the first-in-range-edge-wins selection of the plain scan.
+_EDGE_INDEX = sorted(
+    (edge_energy, element_index, candidate_index, key)
+    for element_index, (_, _, candidates) in enumerate(_EDGE_CANDIDATES)
+    for candidate_index, (key, edge_energy) in enumerate(candidates)
+)
+_EDGE_INDEX_ENERGIES = [entry[0] for entry in _EDGE_INDEX]
+
+# Device names that are written in lower case in the column headings.
+# Built once at import time so the header parsing loop does not rebuild
+# the set for every term.
+_LOWER_DEV_NAMES = frozenset(["pncaux", "pncid"])
+
+# Column names used across the dataset for each XDI field, in order of
+# preference. Shared by every normalize_dataframe call; do not mutate.
+_XDI_ENERGY_COLUMN = "Mono Energy"
+_XDI_KEYWORDS = {
+    "time": ["Scaler preset time", "None"],
+    "i0": ["I0", "IO", "I-0"],
+    "itrans": ["IT", "I1", "I", "It", "Trans"],
+    "ifluor": [
+        "Ifluor",
+        "IF",
+        "If",
+        "Cal Diode",
+        "Cal-diode",
+        "CalDiode",
+        "Cal_Diode",
+        "Cal_diode",
+        "Canberra",
+    ],
+    "irefer": ["Iref", "IRef", "I2", "IR", "IREF", "DiodeRef", "Cal(Iref)", "Ref"],
+}
+
+# Inverted view of _XDI_KEYWORDS built once at import time. Maps a raw
+# column name straight to its XDI field and its position in the
+# preference list, so normalization scans the columns once instead of
+# testing every keyword against the column set.
+_XDI_COLUMN_MAP = {
+    name: (key, priority)
+    for key, names in _XDI_KEYWORDS.items()
+    if key != "time"
+    for priority, name in enumerate(names)
+}
+
 
 def mangle_dup_names(names):
+    # Most files have no duplicated headings; skip the per-name
+    # bookkeeping entirely in that case
+    if len(set(names)) == len(names):
+        return names
+
     d = defaultdict(int)
 
     out = []
@@ -61,9 +143,71 @@ class ParsingCase(Enum):
     shutter = 13
 
 
-def parse_heald_labview(file, no_device=False):
-    lines = file.readlines()
+# Section tags that appear verbatim as a full header line. One dict
+# lookup replaces a cascade of string comparisons per line; the tag line
+# itself carries no data, so the parsing loop skips to the next line.
+_EXACT_SECTION_TAGS = {
+    "Column Headings:": ParsingCase.column,
+    "User Comment:": ParsingCase.user,
+    "Scan config:": ParsingCase.scan,
+    "Amplifier Sensitivities:": ParsingCase.amplifier,
+    "Mono Info:": ParsingCase.mono,
+    "ID Info:": ParsingCase.id_info,
+    "Slit Info:": ParsingCase.slit,
+    "Motor Positions:": ParsingCase.motor,
+}
 
+# Known quirks in the Column Headings line, fixed in one scan with a
+# single precompiled alternation instead of one str.replace pass each.
+# The scatter_Sum entry also covers the spelling produced when "*"
+# separates the two words, which the old sequential replaces handled by
+# rewriting "*" first.
+_COLUMN_FIXES = {
+    "*": " ",
+    "tempeXMAP4": "tempe        XMAP4",
+    "scatter_Sum XMAP4": "scatter_Sum        XMAP4",
+    "scatter_Sum*XMAP4": "scatter_Sum        XMAP4",
+    "Stats1:TS20-": "Stats1:T        S20-",
+}
+_COLUMN_FIXES_RE = re.compile(r"scatter_Sum[* ]XMAP4|tempeXMAP4|Stats1:TS20-|\*")
+
+# Tags that are only a substring of their line. The boolean marks tags
+# whose line carries no data; the LabVIEW Control Panel and Beamline
+# lines keep their data on the tag line itself and must still be parsed.
+_SUBSTRING_SECTION_TAGS = (
+    ("Analog Input Voltages", ParsingCase.analog, True),
+    ("LabVIEW Control Panel", ParsingCase.panel, False),
+    ("Beamline", ParsingCase.beamline, False),
+    ("XIA Filters:", ParsingCase.xia, True),
+    ("XIA Shutter Unit:", ParsingCase.shutter, True),
+)
+
+# How each parsing case stores its block, replacing one hand-written
+# branch per section with a table lookup. Key/value sections split the
+# line on a separator and fold "name: value" pairs into a dict (the
+# boolean marks sections that need a space restored after "OUT"); list
+# sections store the split line as-is; text sections accumulate one line
+# per call, collapsing white space when the boolean says so.
+_KV_SECTIONS = {
+    ParsingCase.amplifier: ("amplifier_sensitivities", "  ", False),
+    ParsingCase.analog: ("analog_input_voltages", "  ", False),
+    ParsingCase.mono: ("mono_info", "; ", False),
+    ParsingCase.xia: ("xia_filter", "  ", True),
+    ParsingCase.shutter: ("xia_shutter_unit", "  ", True),
+}
+_LIST_SECTIONS = {
+    ParsingCase.id_info: ("id_info", "  "),
+    ParsingCase.panel: ("file", "; "),
+}
+_TEXT_SECTIONS = {
+    ParsingCase.user: ("user_comment", True),
+    ParsingCase.scan: ("scan_config", True),
+    ParsingCase.slit: ("slit_info", False),
+    ParsingCase.motor: ("motor_positions", False),
+}
+
+
+def parse_heald_labview(file, no_device=False):
     parsing_case = 0
     headers = []
     data = []
@@ -71,10 +215,14 @@ def parse_heald_labview(file, no_device=False):
     meta_dict = {}
     first_line = True
 
-    for line in lines:
+    # Iterate the file object directly instead of materializing every
+    # line up front with readlines()
+    for line in file:
         line = line.rstrip()
+        if not line:
+            continue
         # Parse comments as metadata
-        if line[0] == "#":
+        if line.startswith("#"):
             if len(line) > 2:
                 # The next line after the Column Headinds tag is the only line
                 # that does not include a white space after the comment/hash symbol
@@ -88,60 +236,26 @@ def parse_heald_labview(file, no_device=False):
                 # header comments
                 # Start reading the name of the upcoming block of information
 
-                if line == "Column Headings:":
-                    parsing_case = ParsingCase.column  # Create headers for dataframe
-                    continue
-                elif line == "User Comment:":
-                    comment_lines = []
-                    parsing_case = ParsingCase.user
-                    continue
-                elif line == "Scan config:":
-                    comment_lines = []
-                    parsing_case = ParsingCase.scan
-                    continue
-                elif line == "Amplifier Sensitivities:":
-                    comment_lines = []
-                    parsing_case = ParsingCase.amplifier
-                    continue
-                elif line.find("Analog Input Voltages") != -1:
-                    comment_lines = []
-                    parsing_case = ParsingCase.analog
-                    continue
-                elif line == "Mono Info:":
-                    comment_lines = []
-                    parsing_case = ParsingCase.mono
-                    continue
-                elif line == "ID Info:":
+                section_tag = _EXACT_SECTION_TAGS.get(line)
+                if section_tag is not None:
                     comment_lines = []
-                    parsing_case = ParsingCase.id_info
+                    parsing_case = section_tag
                     continue
-                elif line == "Slit Info:":
-                    comment_lines = []
-                    parsing_case = ParsingCase.slit
-                    continue
-                elif line == "Motor Positions:":
-                    comment_lines = []
-                    parsing_case = ParsingCase.motor
-                    continue
-                elif line.find("LabVIEW Control Panel") != -1:
-                    comment_lines = []
-                    parsing_case = ParsingCase.panel
-                elif line.find("Beamline") != -1:
-                    parsing_case = ParsingCase.beamline
-                elif line.find("XIA Filters:") != -1:
-                    parsing_case = ParsingCase.xia
-                    continue
-                elif line.find("XIA Shutter Unit:") != -1:
-                    parsing_case = ParsingCase.shutter
+                for tag, tag_case, tag_only in _SUBSTRING_SECTION_TAGS:
+                    if tag in line:
+                        parsing_case = tag_case
+                        break
+                else:
+                    tag_only = False
+                if tag_only:
                     continue
 
                 # Reads the following lines to parse a block of information
                 # with a specific format
                 if parsing_case == ParsingCase.column:
-                    line = line.replace("*", " ")
-                    line = line.replace("tempeXMAP4", "tempe        XMAP4")
-                    line = line.replace("scatter_Sum XMAP4", "scatter_Sum        XMAP4")
-                    line = line.replace("Stats1:TS20-", "Stats1:T        S20-")
+                    line = _COLUMN_FIXES_RE.sub(
+                        lambda match: _COLUMN_FIXES[match.group(0)], line
+                    )
 
                     if not no_device:
                         headers = [term.lstrip() for term in line.split("  ") if term]
@@ -149,94 +263,63 @@ def parse_heald_labview(file, no_device=False):
                         for term in line.split("  "):
                             if term:
                                 term = term.lstrip()
-                                index_list = find_char_indexes(term, ":")
-                                if len(index_list) == 0:
+                                # Only the first and last colon positions
+                                # matter, so look them up directly instead
+                                # of collecting every index
+                                first_colon = term.find(":")
+                                if first_colon == -1:
                                     headers.append(term)
                                 else:
-                                    lower_dev_names = set(["pncaux", "pncid"])
                                     if (
-                                        term[: index_list[0]].isupper()
-                                        or term[: index_list[0]] in lower_dev_names
+                                        term[:first_colon].isupper()
+                                        or term[:first_colon] in _LOWER_DEV_NAMES
                                     ):
                                         temp_term = term[
-                                            index_list[0] + 1 :  # noqa: E203
+                                            first_colon + 1 :  # noqa: E203
                                         ]
                                     else:
-                                        temp_term = term[: index_list[-1]]
+                                        temp_term = term[: term.rfind(":")]
                                     headers.append(temp_term)
 
                     meta_dict["columns"] = headers
                     parsing_case = 0
-                elif parsing_case == ParsingCase.user:
-                    line = " ".join(line.split())  # Remove unwanted white spaces
-                    comment_lines.append(line)
-                    meta_dict["user_comment"] = comment_lines
-                elif parsing_case == ParsingCase.scan:
-                    line = " ".join(line.split())  # Remove unwanted white spaces
-                    comment_lines.append(line)
-                    meta_dict["scan_config"] = comment_lines
-                elif parsing_case == ParsingCase.amplifier:
-                    comment_lines = line.split("  ")
-                    amplifier_dict = {}
-                    for element in comment_lines:
-                        key, value = element.split(": ", 1)
-                        amplifier_dict[key] = value
-                    meta_dict["amplifier_sensitivities"] = amplifier_dict
-                elif parsing_case == ParsingCase.analog:
-                    comment_lines = line.split("  ")
-                    analog_dict = {}
-                    for element in comment_lines:
-                        key, value = element.split(": ", 1)
-                        analog_dict[key] = value
-                    meta_dict["analog_input_voltages"] = analog_dict
-                elif parsing_case == ParsingCase.mono:
-                    comment_lines = line.split("; ")
-                    mono_dict = {}
-                    for element in comment_lines:
+                elif parsing_case in _KV_SECTIONS:
+                    meta_key, separator, fix_out = _KV_SECTIONS[parsing_case]
+                    if fix_out:
+                        line = line.replace("OUT", "OUT ")
+                    section_dict = {}
+                    for element in line.split(separator):
                         key, value = element.split(": ", 1)
-                        mono_dict[key] = value
-                    meta_dict["mono_info"] = mono_dict
-                elif parsing_case == ParsingCase.id_info:
-                    comment_lines = line.split("  ")
-                    meta_dict["id_info"] = comment_lines
-                elif parsing_case == ParsingCase.slit:
+                        section_dict[key] = value
+                    meta_dict[meta_key] = section_dict
+                elif parsing_case in _TEXT_SECTIONS:
+                    meta_key, collapse_spaces = _TEXT_SECTIONS[parsing_case]
+                    if collapse_spaces:
+                        line = " ".join(line.split())  # Remove unwanted white spaces
                     comment_lines.append(line)
-                    meta_dict["slit_info"] = comment_lines
-                elif parsing_case == ParsingCase.motor:
-                    comment_lines.append(line)
-                    meta_dict["motor_positions"] = comment_lines
-                elif parsing_case == ParsingCase.panel:
-                    comment_lines = line.split("; ")
-                    meta_dict["file"] = comment_lines
+                    meta_dict[meta_key] = comment_lines
+                elif parsing_case in _LIST_SECTIONS:
+                    meta_key, separator = _LIST_SECTIONS[parsing_case]
+                    meta_dict[meta_key] = line.split(separator)
                 elif parsing_case == ParsingCase.beamline:
                     meta_dict["beamline"] = line
-                elif parsing_case == ParsingCase.xia:
-                    line = line.replace("OUT", "OUT ")
-                    comment_lines = line.split("  ")
-                    xia_dict = {}
-                    for element in comment_lines:
-                        key, value = element.split(": ", 1)
-                        xia_dict[key] = value
-                    meta_dict["xia_filter"] = xia_dict
-                elif parsing_case == ParsingCase.shutter:
-                    line = line.replace("OUT", "OUT ")
-                    comment_lines = line.split("  ")
-                    shutter_dict = {}
-                    for element in comment_lines:
-                        key, value = element.split(": ", 1)
-                        shutter_dict[key] = value
-                    meta_dict["xia_shutter_unit"] = shutter_dict
             else:
                 parsing_case = 0
                 continue
         # Parse data
         else:
-            line = " ".join(line.split())  # Remove unwanted white spaces
-            sample = line.split()
-            sample = list(map(float, sample))
-            data.append(sample)
+            data.append(line.split())
 
     headers = mangle_dup_names(headers)
+    if data:
+        try:
+            # Convert the whole block in one vectorized pass instead of
+            # one float() call per value
+            data = np.array(data, dtype=float)
+        except ValueError:
+            # Rows of unequal length cannot be stacked; fall back to the
+            # row-wise conversion
+            data = [list(map(float, sample)) for sample in data]
     df = pd.DataFrame(data, columns=headers)
 
     return df, meta_dict
@@ -246,34 +329,42 @@ def find_char_indexes(word, char):
     return [i for i, val in enumerate(word) if val == char]
 
 
-def build_reader(filepath, no_device=False):
+def _read_labview_file(filepath, no_device=False):
+    # Shared open/parse/empty-check body of the reader builders, so the
+    # parsing path is maintained and optimized in one place
     with open(filepath) as file:
         df, metadata = parse_heald_labview(file, no_device)
-        if df.empty:
-            return None
+    if df.empty:
+        return None, None
+    return df, metadata
+
+
+def build_reader(filepath, no_device=False):
+    df, metadata = _read_labview_file(filepath, no_device)
+    if df is None:
+        return None
     return DataFrameAdapter.from_pandas(df, metadata=metadata, npartitions=1)
 
 
 def complete_build_reader(filepath, no_device=False):
-    with open(filepath) as file:
-        df, metadata = parse_heald_labview(file, no_device)
-        if df.empty:
-            return None
+    df, metadata = _read_labview_file(filepath, no_device)
+    if df is None:
+        return None
 
-        std_df, changed_columns = normalize_dataframe(df, standardize=True)
-        if std_df is None:
-            return DataFrameAdapter.from_pandas(df, metadata=metadata, npartitions=1)
-        else:
-            metadata["columns"] = list(std_df.columns)
-            element_name, edge_symbol = parse_element_name(filepath, std_df, metadata)
+    std_df, changed_columns = normalize_dataframe(df, standardize=True)
+    if std_df is None:
+        return DataFrameAdapter.from_pandas(df, metadata=metadata, npartitions=1)
 
-            metadata["element"] = {"symbol": element_name, "edge": edge_symbol}
-            metadata["common"] = {
-                "element": {"symbol": element_name, "edge": edge_symbol}
-            }
-            metadata["translation"] = changed_columns
+    metadata["columns"] = list(std_df.columns)
+    element_name, edge_symbol = parse_element_name(filepath, std_df, metadata)
 
-        return DataFrameAdapter.from_pandas(std_df, metadata=metadata, npartitions=1)
+    # Build the element record once and reference it from both keys
+    element = {"symbol": element_name, "edge": edge_symbol}
+    metadata["element"] = element
+    metadata["common"] = {"element": element}
+    metadata["translation"] = changed_columns
+
+    return DataFrameAdapter.from_pandas(std_df, metadata=metadata, npartitions=1)
 
 
 def is_candidate(filename):
@@ -283,36 +374,41 @@ def is_candidate(filename):
 
 def iter_subdirectory(mapping, path, normalize=False):
     experiment_group = {}
-    filepaths = sorted(path.iterdir())
-    for i in range(len(filepaths)):
-        if filepaths[i].name.startswith("."):
+    # One scandir enumeration hands back entries with their file type
+    # already cached, instead of a stat round trip per path. The sorted
+    # path list is kept for the next-file lookahead below.
+    with os.scandir(path) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+    filepaths = [Path(entry.path) for entry in entries]
+    for i, entry in enumerate(entries):
+        filepath = filepaths[i]
+        if filepath.name.startswith("."):
             # Skip hidden files.
             continue
-        if not filepaths[i].is_file():
+        if not entry.is_file():
             # Explore subfolder for more labview files recursively
             sub_mapping = {}
-            sub_mapping = iter_subdirectory(sub_mapping, filepaths[i], normalize)
+            sub_mapping = iter_subdirectory(sub_mapping, filepath, normalize)
             if sub_mapping:
-                mapping[filepaths[i].name] = MapAdapter(sub_mapping)
+                mapping[filepath.name] = MapAdapter(sub_mapping)
             continue
-        if filepaths[i].suffix[1:].isnumeric():
-            if filepaths[i].stem not in experiment_group:
-                experiment_group[filepaths[i].stem] = {}
+        if filepath.suffix[1:].isnumeric():
+            # Fetch the experiment group once and reuse it instead of
+            # re-resolving the same key around every write
+            group = experiment_group.get(filepath.stem)
+            if group is None:
+                group = experiment_group[filepath.stem] = {}
                 if not normalize:
-                    mapping[filepaths[i].stem] = MapAdapter(
-                        experiment_group[filepaths[i].stem]
-                    )
+                    mapping[filepath.stem] = MapAdapter(group)
             if normalize:
-                norm_node = NormalizedReader(filepaths[i])
+                norm_node = NormalizedReader(filepath)
                 if not norm_node.is_empty():
-                    experiment_group[filepaths[i].stem][
-                        filepaths[i].name
-                    ] = norm_node.read()
+                    group[filepath.name] = norm_node.read()
             else:
-                cache_key = (Path(__file__).stem, filepaths[i])
-                end_node = with_object_cache(cache_key, build_reader, filepaths[i])
+                cache_key = (_CACHE_KEY_PREFIX, filepath)
+                end_node = with_object_cache(cache_key, build_reader, filepath)
                 if end_node is not None:
-                    experiment_group[filepaths[i].stem][filepaths[i].name] = end_node
+                    group[filepath.name] = end_node
 
         # For a normalized tree, experiments files are grouped, filtered and saved
         # temporarily. Once all files of one experiment are read, it checks if there
@@ -320,17 +416,13 @@ def iter_subdirectory(mapping, path, normalize=False):
         # the main tree. This avoids the generation of empty nodes in the final version
         # of the tree.
         if normalize:
-            if filepaths[i].stem in experiment_group:
-                if i == len(filepaths) - 1:
-                    if len(experiment_group[filepaths[i].stem]) != 0:
-                        mapping[filepaths[i].stem] = MapAdapter(
-                            experiment_group[filepaths[i].stem]
-                        )
-                elif filepaths[i].stem != filepaths[i + 1].stem:
-                    if len(experiment_group[filepaths[i].stem]) != 0:
-                        mapping[filepaths[i].stem] = MapAdapter(
-                            experiment_group[filepaths[i].stem]
-                        )
+            group = experiment_group.get(filepath.stem)
+            if group:
+                last_of_experiment = (
+                    i == len(filepaths) - 1 or filepath.stem != filepaths[i + 1].stem
+                )
+                if last_of_experiment:
+                    mapping[filepath.stem] = MapAdapter(group)
 
     return mapping
 
@@ -339,29 +431,32 @@ def complete_tree_iter_subdirectory(mapping, path):
     # This method takes the two strategies implemented in iter_subdirectory() but it creates one single
     # tree instead with the information of both versions when it is available.
     experiment_group = {}
-    filepaths = sorted(path.iterdir())
-    for i in range(len(filepaths)):
-        if filepaths[i].name.startswith("."):
+    # One scandir enumeration hands back entries with their file type
+    # already cached, instead of a stat round trip per path
+    with os.scandir(path) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+    for entry in entries:
+        filepath = Path(entry.path)
+        if filepath.name.startswith("."):
             # Skip hidden files.
             continue
-        if not filepaths[i].is_file():
+        if not entry.is_file():
             # Explore subfolder for more labview files recursively
             sub_mapping = {}
-            sub_mapping = complete_tree_iter_subdirectory(sub_mapping, filepaths[i])
+            sub_mapping = complete_tree_iter_subdirectory(sub_mapping, filepath)
             if sub_mapping:
-                mapping[filepaths[i].name] = MapAdapter(sub_mapping)
+                mapping[filepath.name] = MapAdapter(sub_mapping)
             continue
-        if filepaths[i].suffix[1:].isnumeric():
-            if filepaths[i].stem not in experiment_group:
-                experiment_group[filepaths[i].stem] = {}
-                mapping[filepaths[i].stem] = MapAdapter(
-                    experiment_group[filepaths[i].stem]
-                )
-
-            cache_key = (Path(__file__).stem, filepaths[i])
-            end_node = with_object_cache(cache_key, complete_build_reader, filepaths[i])
+        if filepath.suffix[1:].isnumeric():
+            group = experiment_group.get(filepath.stem)
+            if group is None:
+                group = experiment_group[filepath.stem] = {}
+                mapping[filepath.stem] = MapAdapter(group)
+
+            cache_key = (_CACHE_KEY_PREFIX, filepath)
+            end_node = with_object_cache(cache_key, complete_build_reader, filepath)
             if end_node is not None:
-                experiment_group[filepaths[i].stem][filepaths[i].name] = end_node
+                group[filepath.name] = end_node
 
     return mapping
 
@@ -389,55 +484,47 @@ def complete_subdirectory_handler(path):
 
 
 def normalize_dataframe(df, standardize=False):
-    energy = "Mono Energy"
-    keywords = {
-        "time": ["Scaler preset time", "None"],
-        "i0": ["I0", "IO", "I-0"],
-        "itrans": ["IT", "I1", "I", "It", "Trans"],
-        "ifluor": [
-            "Ifluor",
-            "IF",
-            "If",
-            "Cal Diode",
-            "Cal-diode",
-            "CalDiode",
-            "Cal_Diode",
-            "Cal_diode",
-            "Canberra",
-        ],
-        "irefer": ["Iref", "IRef", "I2", "IR", "IREF", "DiodeRef", "Cal(Iref)", "Ref"],
-    }
-    column_names = set(df.columns.values.tolist())
+    energy = _XDI_ENERGY_COLUMN
+    keywords = _XDI_KEYWORDS
+    column_names = set(df.columns)
     changed_names = {}
     norm_df = None
 
     if energy in column_names:
+        # Single pass over the columns; keep the best-ranked source name
+        # for each XDI field instead of testing every keyword in turn
+        best_matches = {}
+        for name in column_names:
+            match = _XDI_COLUMN_MAP.get(name)
+            if match is not None:
+                key, priority = match
+                if key not in best_matches or priority < best_matches[key][0]:
+                    best_matches[key] = (priority, name)
+
+        for key in keywords:
+            if key == "time" or key not in best_matches:
+                # A field without any matching column does not meet the
+                # XDI standards
+                # Uncomment the next lines to make the normalized filter
+                # more strict
+                # if key != "time":
+                #     return None, changed_names
+                continue
+            changed_names[key] = best_matches[key][1]
+
+        rename_map = {energy: "energy"}
+        for key, name in changed_names.items():
+            rename_map[name] = key
         if standardize:
-            norm_df = df.copy()
-            norm_df = norm_df.rename({energy: "energy"}, axis="columns")
+            # A single rename applies every change and already returns a
+            # copy, instead of copying first and renaming one column at
+            # a time
+            norm_df = df.rename(columns=rename_map)
         else:
-            norm_df = pd.DataFrame()
-            norm_df["energy"] = df[energy]
-
-        for key, value in keywords.items():
-            if key != "time":
-                counter = 0
-                for name in value:
-                    if name in column_names:
-                        changed_names[key] = name
-                        if standardize:
-                            norm_df = norm_df.rename({name: key}, axis="columns")
-                        else:
-                            norm_df[key] = df[name]
-                        break
-                    counter += 1
-
-                    # Reached the end of the list and found nothing for one variable
-                    # Must return None because it does not meet the XDI standards
-                    # Uncomment the next lines to make the normalized filter more strict
-                    # if counter == len(value):
-                    #     norm_df = None
-                    #     return norm_df
+            # One selection copies every matched column in a single pass
+            # instead of inserting (and index-aligning) them one by one
+            # into an empty frame
+            norm_df = df[list(rename_map)].rename(columns=rename_map)
 
     return norm_df, changed_names
 
@@ -446,46 +533,38 @@ def parse_element_name(filepath, df, metadata):
 
     element_name = None
     edge_symbol = None
-    if "energy" in set(df.keys()):
-        energy = df["energy"]
+    if "energy" in df.columns:
+        energy = df["energy"].to_numpy()
         if len(energy) > 1:
-            min_max = [min(energy), max(energy)]
+            energy_min = energy.min()
+            energy_max = energy.max()
 
-            element_list = {}
             # Find if the edge value of an element in xrayDB is inside the range of
             # Mono Energy values of the current file
             # An element in XrayDB can contain more than one edge, each one identified by
-            # a unique IUPAC symbol
-            for current_element, values in _EDGE_ENERGY_DICT.items():
-                edges = values[1]
-                # Most of the cases are solved with a 'K' edge value. This is added to
-                # improve computing time
-                if "K" in edges:
-                    if (
-                        edges["K"].energy >= min_max[0]
-                        and edges["K"].energy <= min_max[1]
-                    ):
-                        element_list[current_element] = [
-                            values[0],
-                            current_element,
-                            "K",
-                            edges["K"].energy,
-                            False,
-                        ]
-                else:
-                    for key in edges:
-                        if (
-                            edges[key].energy >= min_max[0]
-                            and edges[key].energy <= min_max[1]
-                        ):
-                            element_list[current_element] = [
-                                values[0],
-                                current_element,
-                                key,
-                                edges[key].energy,
-                                False,
-                            ]
-                            break
+            # a unique IUPAC symbol. Bisect the precomputed index down to the
+            # in-range window, then keep the earliest edge per element.
+            low = bisect.bisect_left(_EDGE_INDEX_ENERGIES, energy_min)
+            high = bisect.bisect_right(_EDGE_INDEX_ENERGIES, energy_max)
+            best_edges = {}
+            for edge_energy, element_index, candidate_index, key in _EDGE_INDEX[
+                low:high
+            ]:
+                found = best_edges.get(element_index)
+                if found is None or candidate_index < found[0]:
+                    best_edges[element_index] = (candidate_index, key, edge_energy)
+
+            element_list = {}
+            for element_index in sorted(best_edges):
+                candidate_index, key, edge_energy = best_edges[element_index]
+                current_element, number, _ = _EDGE_CANDIDATES[element_index]
+                element_list[current_element] = [
+                    number,
+                    current_element,
+                    key,
+                    edge_energy,
+                    False,
+                ]
 
             # Find if the matching elements are named in the parsed metadata
             # Must considered cases with none or multiple matches
@@ -537,11 +616,15 @@ def parse_element_name(filepath, df, metadata):
 class HealdLabViewTree(MapAdapter):
     @classmethod
     def from_directory(cls, directory):
-        mapping = {
-            filename: build_reader(Path(directory, filename))
-            for filename in os.listdir(directory)
-            if is_candidate(filename)
-        }
+        with os.scandir(directory) as entries:
+            filenames = [entry.name for entry in entries if is_candidate(entry.name)]
+        # The files are independent and parsing is dominated by file I/O,
+        # which releases the GIL, so read them concurrently
+        with ThreadPoolExecutor() as executor:
+            readers = executor.map(
+                lambda filename: build_reader(Path(directory, filename)), filenames
+            )
+            mapping = dict(zip(filenames, readers))
         return cls(mapping)
 
 
@@ -551,25 +634,31 @@ class RIXSImagesAndTable(MapAdapter):
         import tifffile
         from tiled.adapters.tiff import TiffSequenceAdapter
 
-        mapping = {
-            name: MapAdapter(
-                {
-                    "table": build_reader(Path(directory, name)),
-                    "images": TiffSequenceAdapter(
-                        tifffile.TiffSequence(f"{Path(directory,name)}.Eiger/*")
-                    ),
-                }
-            )
-            for name in os.listdir(directory)
-            if not os.path.isdir(Path(directory, name))
-        }
+        # DirEntry caches the stat result, so the is_dir check does not
+        # hit the filesystem once per name
+        mapping = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    continue
+                # Join the path once and derive the sibling .Eiger
+                # directory from it instead of rebuilding both joins
+                filepath = Path(entry.path)
+                mapping[entry.name] = MapAdapter(
+                    {
+                        "table": build_reader(filepath),
+                        "images": TiffSequenceAdapter(
+                            tifffile.TiffSequence(f"{filepath}.Eiger/*")
+                        ),
+                    }
+                )
         return cls(mapping)
 
 
 class NormalizedReader:
     def __init__(self, filepath):
         cache_key = (
-            Path(__file__).stem,
+            _CACHE_KEY_PREFIX,
             filepath,
         )  # exact same key you used for build_reader
         # Make an UNnoramlized reader first.
@@ -592,9 +681,11 @@ class NormalizedReader:
         element_name, edge_symbol = parse_element_name(
             self._current_filepath, norm_df, self._unnormalized_reader.metadata
         )
+        # Build the element record once and reference it from both keys
+        element = {"symbol": element_name, "edge": edge_symbol}
         norm_metadata = {
-            "Element": {"symbol": element_name, "edge": edge_symbol},
-            "common": {"element": {"symbol": element_name, "edge": edge_symbol}},
+            "Element": element,
+            "common": {"element": element},
             "Translation": changed_columns,
         }
         return DataFrameAdapter.from_pandas(
@@ -24,14 +24,16 @@ class LabviewFileReader:
         self._file = open(path, "r")
 
     def parse_file(self):
-        lines = self._file.readlines()
-
         parsing_case = 0
-        data = []
+        headers = []
         comment_lines = []
         meta_dict = {}
-        for line in lines:
+        first_data = None
+        for line in self._file:
             line = line.rstrip()
+            if not line:
+                # Skip blank lines so header parsing resumes after them
+                continue
             # Parse comments as metadata
             if line[0] == "#":
                 if len(line) > 2:
@@ -145,9 +147,44 @@ class LabviewFileReader:
                     continue
             # Parse data
             else:
-                line = " ".join(line.split())  # Remove unwanted white spaces
-                sample = line.split()
-                sample = list(map(float, sample))
-                data.append(sample)
-        df = pd.DataFrame(data, columns=headers)
+                # The header is finished; stop the Python line loop and
+                # let pandas' C parser consume the rest of the file
+                first_data = line
+                break
+
+        try:
+            # Let pandas infer the field count and compare it to the
+            # headers, so a width mismatch cannot slip into the index or
+            # get truncated silently
+            df = pd.read_csv(
+                self._file,
+                sep=r"\s+",
+                header=None,
+                comment="#",
+                dtype=float,
+            )
+            if len(df.columns) != len(headers):
+                raise ValueError(
+                    f"{len(headers)} columns passed, "
+                    f"passed data had {len(df.columns)} columns"
+                )
+            df.columns = headers
+            if first_data:
+                first_row = pd.DataFrame(
+                    [first_data.split()], columns=headers, dtype=float
+                )
+                df = pd.concat([first_row, df], ignore_index=True)
+        except (pd.errors.ParserError, ValueError):
+            # Rows that do not match the headers (the dataset contains such
+            # files; see scripts/files/heald_corrupt_files.txt) cannot go
+            # through the C parser. Fall back to the row-wise conversion,
+            # which NaN-pads short rows and fails loudly on extra fields.
+            self._file.seek(0)
+            data = []
+            for line in self._file:
+                line = line.rstrip()
+                if not line or line[0] == "#":
+                    continue
+                data.append(list(map(float, line.split())))
+            df = pd.DataFrame(data, columns=headers)
         return df, meta_dict
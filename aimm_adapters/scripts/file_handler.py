@@ -1,14 +1,64 @@
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import xraydb
 
+# Per-file diagnostics go through the logger so large sweeps do not pay
+# a stdout flush per file; enable them with logging.DEBUG when needed
+logger = logging.getLogger(__name__)
+
 _EDGE_ENERGY_DICT = {
     xraydb.atomic_symbol(i): [i, xraydb.xray_edges(i)] for i in range(1, 99)
 }
 
 
+def _element_edge_candidates(element, values):
+    number, edges = values
+    # Most of the cases are solved with a 'K' edge value. This is added to
+    # improve computing time
+    if "K" in edges:
+        candidates = (("K", edges["K"].energy),)
+    else:
+        candidates = tuple((key, edge.energy) for key, edge in edges.items())
+    return element, number, candidates
+
+
+# Edge energies flattened into parallel structures at import time, so the
+# in-range test in parse_element_name is one numpy broadcast over every
+# candidate edge instead of a Python loop per element
+_EDGE_CANDIDATES = [
+    _element_edge_candidates(element, values)
+    for element, values in _EDGE_ENERGY_DICT.items()
+]
+_EDGE_FLAT = [
+    (element_index, key, edge_energy)
+    for element_index, (_, _, candidates) in enumerate(_EDGE_CANDIDATES)
+    for key, edge_energy in candidates
+]
+_EDGE_FLAT_ENERGIES = np.array([edge_energy for _, _, edge_energy in _EDGE_FLAT])
+
+# Device names that are written in lower case in the column headings.
+# Built once at import time instead of once per parsed term.
+# parse_columns recognizes one more name than parse_labview_file, which
+# mirrors heald_labview.parse_heald_labview and must keep its set.
+_LOWER_DEV_NAMES = frozenset(["pncaux", "pncid", "s20ptc10"])
+_LABVIEW_LOWER_DEV_NAMES = frozenset(["pncaux", "pncid"])
+
+# Matches the Column Headings tag and captures the headings line that
+# follows it, so a single regex sweep over the header block can replace
+# the line-by-line parsing state machine when only the column names are
+# needed.
+_COLUMN_HEADINGS_RE = re.compile(r"^# ?Column Headings:[ \t]*\n#(.*)$", re.MULTILINE)
+
+
 class ParsingCase(Enum):
     column = 1
     user = 2
@@ -33,17 +83,20 @@ def parse_columns(file, no_device=False):
     # Used for testing purposes only.
     # Mainly to compare the structure of the columns and column names.
 
-    lines = file.readlines()
-
     parsing_case = 0
     parsed_columns = []
     data_size = 0
     first_line = True
 
-    for line in lines:
+    # Iterate the file object directly instead of slurping it with
+    # readlines(); the break below then stops the I/O stream early
+    # instead of just abandoning an already-read list
+    for line in file:
         line = line.rstrip()
+        if not line:
+            continue
         # Parse comments as metadata
-        if line[0] == "#":
+        if line.startswith("#"):
             if len(line) > 2:
                 # The next line after the Column Headinds tag is the only line
                 # that does not include a white space after the comment/hash symbol
@@ -75,20 +128,22 @@ def parse_columns(file, no_device=False):
                         for term in line.split("  "):
                             if term:
                                 term = term.lstrip()
-                                ch_list = find_char_indexes(term, ":")
-                                if len(ch_list) == 0:
+                                # Only the first and last colon positions
+                                # matter, so look them up directly instead
+                                # of collecting every index
+                                first_colon = term.find(":")
+                                if first_colon == -1:
                                     parsed_columns.append(term.lstrip())
                                 else:
-                                    lower_dev_names = set(
-                                        ["pncaux", "pncid", "s20ptc10"]
-                                    )
                                     if (
-                                        term[: ch_list[0]].isupper()
-                                        or term[: ch_list[0]] in lower_dev_names
+                                        term[:first_colon].isupper()
+                                        or term[:first_colon] in _LOWER_DEV_NAMES
                                     ):
-                                        temp_term = term[ch_list[0] + 1 :]  # noqa: E203
+                                        temp_term = term[
+                                            first_colon + 1 :  # noqa: E203
+                                        ]
                                     else:
-                                        temp_term = term[: ch_list[-1]].lstrip()
+                                        temp_term = term[: term.rfind(":")].lstrip()
                                     parsed_columns.append(temp_term)
 
             else:
@@ -103,7 +158,7 @@ def parse_columns(file, no_device=False):
                 try:
                     sample = list(map(float, sample))
                 except ValueError:
-                    print(file.name)
+                    logger.debug("%s", file.name)
                 data_size = len(sample)
                 break
 
@@ -202,20 +257,23 @@ def parse_labview_file(file, no_device=False):
                         for term in line.split("  "):
                             if term:
                                 term = term.lstrip()
-                                index_list = find_char_indexes(term, ":")
-                                if len(index_list) == 0:
+                                # Only the first and last colon positions
+                                # matter, so look them up directly instead
+                                # of collecting every index
+                                first_colon = term.find(":")
+                                if first_colon == -1:
                                     headers.append(term)
                                 else:
-                                    lower_dev_names = set(["pncaux", "pncid"])
                                     if (
-                                        term[: index_list[0]].isupper()
-                                        or term[: index_list[0]] in lower_dev_names
+                                        term[:first_colon].isupper()
+                                        or term[:first_colon]
+                                        in _LABVIEW_LOWER_DEV_NAMES
                                     ):
                                         temp_term = term[
-                                            index_list[0] + 1 :  # noqa: E203
+                                            first_colon + 1 :  # noqa: E203
                                         ]
                                     else:
-                                        temp_term = term[: index_list[-1]]
+                                        temp_term = term[: term.rfind(":")]
                                     headers.append(temp_term)
 
                     meta_dict["Columns"] = headers
@@ -284,10 +342,17 @@ def parse_labview_file(file, no_device=False):
                 continue
         # Parse data
         else:
-            line = " ".join(line.split())  # Remove unwanted white spaces
-            sample = line.split()
-            sample = list(map(float, sample))
-            data.append(sample)
+            data.append(line.split())
+
+    if data:
+        try:
+            # Convert the whole block in one vectorized pass instead of
+            # one float() call per value
+            data = np.array(data, dtype=float)
+        except ValueError:
+            # Rows of unequal length cannot be stacked; fall back to the
+            # row-wise conversion
+            data = [list(map(float, sample)) for sample in data]
     df = pd.DataFrame(data, columns=headers)
 
     return df, meta_dict
@@ -297,6 +362,36 @@ def find_char_indexes(word, char):
     return [i for i, val in enumerate(word) if val == char]
 
 
+# Memo for parse_columns_cached keyed by path, modification time and file
+# size. The exploration helpers below revisit the same files many times
+# (once per keyword pass, grouping strategy, etc.); the memo makes reruns
+# over an unchanged dataset skip the reparse entirely. Least recently
+# used entries are evicted once the memo is full, so sweeping a large
+# dataset cannot grow it without bound. The lock keeps the lookup,
+# insert, eviction and recency update consistent when the memo is hit
+# from the thread pool in iter_count_keywords.
+_PARSE_COLUMNS_CACHE = OrderedDict()
+_PARSE_COLUMNS_CACHE_SIZE = 4096
+_PARSE_COLUMNS_CACHE_LOCK = threading.Lock()
+
+
+def parse_columns_cached(filepath, no_device=False):
+    stat = filepath.stat()
+    key = (str(filepath), stat.st_mtime_ns, stat.st_size, no_device)
+    with _PARSE_COLUMNS_CACHE_LOCK:
+        result = _PARSE_COLUMNS_CACHE.get(key)
+        if result is not None:
+            _PARSE_COLUMNS_CACHE.move_to_end(key)
+            return result
+    with open(filepath) as file:
+        result = parse_columns(file, no_device)
+    with _PARSE_COLUMNS_CACHE_LOCK:
+        _PARSE_COLUMNS_CACHE[key] = result
+        if len(_PARSE_COLUMNS_CACHE) > _PARSE_COLUMNS_CACHE_SIZE:
+            _PARSE_COLUMNS_CACHE.popitem(last=False)
+    return result
+
+
 def iter_subdirectory_handler(mapping, path):
     # Recursively, creates a tree-like dictionary by grouping files based on the
     # name of experiment. The end nodes save the information of each file contaning
@@ -322,17 +417,20 @@ def iter_subdirectory_handler(mapping, path):
                 columns, column_number = parse_columns(file)
 
             if filepath.stem in test_group:
+                # Walk the nested entry once instead of re-indexing the
+                # mapping on every access
+                entry = mapping[filepath.stem]
                 for element in columns:
                     if element not in name_set:
                         name_set.add(element)
-                        mapping[filepath.stem][0].append(element)
-                        mapping[filepath.stem][2][0] = len(mapping[filepath.stem][0])
-                        print(filepath.name)
+                        entry[0].append(element)
+                        entry[2][0] = len(entry[0])
+                        logger.debug("%s", filepath.name)
 
-                mapping[filepath.stem][1].append(filepath.name)
+                entry[1].append(filepath.name)
 
-                if column_number != mapping[filepath.stem][2][1]:
-                    print(column_number)
+                if column_number != entry[2][1]:
+                    logger.debug("%s", column_number)
 
                 # print(filepath.stem)
             else:
@@ -353,8 +451,6 @@ def iter_subdirectory_handler_v2(mapping, path):
     # Recursively, creates a tree-like dictionary by grouping files based on the
     # name of experiment and similarities between column names
 
-    test_group = set()
-
     for filepath in path.iterdir():
         if filepath.name.startswith("."):
             # Skip hidden files.
@@ -371,17 +467,10 @@ def iter_subdirectory_handler_v2(mapping, path):
                 columns, column_number = parse_columns(file)
                 column_key = tuple(columns)
 
-            if filepath.stem not in test_group:
-                test_group.add(filepath.stem)
-                mapping[filepath.stem] = {}
-                file_value = [filepath.name]
-                mapping[filepath.stem][column_key] = file_value
-            else:
-                if column_key in mapping[filepath.stem].keys():
-                    mapping[filepath.stem][column_key].append(filepath.name)
-                else:
-                    file_value = [filepath.name]
-                    mapping[filepath.stem][column_key] = file_value
+            # setdefault covers both the new-experiment and new-column
+            # cases without the membership checks
+            experiment = mapping.setdefault(filepath.stem, {})
+            experiment.setdefault(column_key, []).append(filepath.name)
 
     return mapping
 
@@ -405,40 +494,58 @@ def iter_subdirectory_handler_v3(mapping, path, keyword):
             with open(filepath) as file:
                 is_column = find_in_file(file, keyword)
 
-            if filepath.stem not in mapping:
-                mapping[filepath.stem] = {keyword: [], "None": []}
+            group = mapping.setdefault(filepath.stem, {keyword: [], "None": []})
             if is_column:
-                mapping[filepath.stem][keyword].append(filepath.name)
+                group[keyword].append(filepath.name)
             else:
-                mapping[filepath.stem]["None"].append(filepath.name)
+                group["None"].append(filepath.name)
 
     return mapping
 
 
-def iter_count_keyword(path, keyword):
-    # Recursively, counts the number of times that a keyword is used in all the files
-    # of the dataset
+def iter_count_keywords(path, keywords):
+    # Recursively, counts the number of times that each of the given keywords is
+    # used in all the files of the dataset. Counting every keyword in a single
+    # pass avoids re-reading the whole dataset once per keyword
 
-    counter = 0
+    counters = dict.fromkeys(keywords, 0)
     total = 0
+    subdirectories = []
+    files = []
     for filepath in path.iterdir():
         if filepath.name.startswith("."):
             # Skip hidden files.
             continue
         if not filepath.is_file():
-            # Explore subfolder for more labview files recursively
-            temp_counter, temp_total = iter_count_keyword(filepath, keyword)
-            counter += temp_counter
-            total += temp_total
-            continue
-        if filepath.suffix[1:].isnumeric():
-            with open(filepath) as file:
-                column_names, column_size = parse_columns(file)
+            subdirectories.append(filepath)
+        elif filepath.suffix[1:].isnumeric():
+            files.append(filepath)
+
+    if files:
+        # The per-file work is dominated by file I/O, which releases the
+        # GIL, so parse the directory's files concurrently
+        with ThreadPoolExecutor() as executor:
+            for column_names, column_size in executor.map(parse_columns_cached, files):
                 column_set = set(column_names)
-                if keyword in column_set:
-                    counter += 1
+                for keyword in keywords:
+                    if keyword in column_set:
+                        counters[keyword] += 1
                 total += 1
-    return counter, total
+
+    # Explore subfolders for more labview files recursively
+    for filepath in subdirectories:
+        temp_counters, temp_total = iter_count_keywords(filepath, keywords)
+        for keyword, temp_counter in temp_counters.items():
+            counters[keyword] += temp_counter
+        total += temp_total
+    return counters, total
+
+
+def iter_count_keyword(path, keyword):
+    # Single-keyword convenience wrapper around iter_count_keywords
+
+    counters, total = iter_count_keywords(path, [keyword])
+    return counters[keyword], total
 
 
 def iter_unique_keywords(path, tracked_set, start=False, count=False, collection=None):
@@ -456,49 +563,52 @@ def iter_unique_keywords(path, tracked_set, start=False, count=False, collection
             )
             continue
         if filepath.suffix[1:].isnumeric():
-            with open(filepath) as file:
-                column_names, column_size = parse_columns(file, no_device=True)
-
-                column_set = set(column_names)
-                if "Mono Energy" in column_set and column_size > 0:
-                    if not count:
-                        # if (
-                        #     "I0" not in column_set
-                        #     and "IO" not in column_set
-                        #     and "I-0" not in column_set
-                        # ):
-                        #     collection_names = ",".join(column_names)
-                        #     collection.add(collection_names)
-                        #     print("Not Unique: ", filepath)
-                        if start:
-                            tracked_set = column_set.copy()
-                            start = False
-                        else:
-                            tracked_set = tracked_set | column_set
+            column_names, column_size = parse_columns_cached(filepath, no_device=True)
+
+            column_set = set(column_names)
+            if "Mono Energy" in column_set and column_size > 0:
+                if not count:
+                    # if (
+                    #     "I0" not in column_set
+                    #     and "IO" not in column_set
+                    #     and "I-0" not in column_set
+                    # ):
+                    #     collection_names = ",".join(column_names)
+                    #     collection.add(collection_names)
+                    #     print("Not Unique: ", filepath)
+                    if start:
+                        tracked_set = column_set.copy()
+                        start = False
                     else:
-                        for set_name in column_set:
-                            if set_name not in tracked_set:
-                                tracked_set[set_name] = 0
-                            tracked_set[set_name] += 1
+                        tracked_set = tracked_set | column_set
+                else:
+                    for set_name in column_set:
+                        tracked_set[set_name] = tracked_set.get(set_name, 0) + 1
 
     return tracked_set, start, collection
 
 
 def iter_dictionary_read(dict_input, level, str_buffer):
-    # Recursively, reads a dictionary and pass it to a buffer
+    # Recursively, reads a dictionary and pass it to a buffer. The pieces
+    # are collected in a list and joined once at the end, instead of
+    # recopying the whole buffer on every += concatenation
+
+    pieces = [str_buffer] if str_buffer else []
+    _iter_dictionary_pieces(dict_input, level, pieces)
+    return "".join(pieces)
+
 
+def _iter_dictionary_pieces(dict_input, level, pieces):
     spacing = "--"
 
     for key, value in dict_input.items():
-        str_buffer += "    " * level + "|" + spacing + " "
-        str_buffer += str(key) + ":"
-        if type(value) == dict:
-            str_buffer += "\n"
-            str_buffer = iter_dictionary_read(value, level + 1, str_buffer)
+        pieces.append("    " * level + "|" + spacing + " ")
+        pieces.append(str(key) + ":")
+        if isinstance(value, dict):
+            pieces.append("\n")
+            _iter_dictionary_pieces(value, level + 1, pieces)
         else:
-            str_buffer += str(value) + "\n"
-
-    return str_buffer
+            pieces.append(str(value) + "\n")
 
 
 def iter_element_name_parse(path):
@@ -517,7 +627,7 @@ def iter_element_name_parse(path):
 
             if not df.empty:
                 element_name, edge_symbol = parse_element_name(filepath, df, metadata)
-                print(element_name, edge_symbol)
+                logger.debug("%s %s", element_name, edge_symbol)
 
 
 def write_file_structure(keyword):
@@ -531,19 +641,42 @@ def write_file_structure(keyword):
     string_buffer = iter_dictionary_read(mapping, 0, "")
 
     # with open("labview_file_tree.txt", "w") as file:
+    # Write to a sibling temp file and swap it into place, so an
+    # interrupted run never leaves a truncated tree file behind
     filename = "files/" + keyword + "_file_tree.txt"
-    with open(filename, "w") as file:
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, "w") as file:
         file.write(string_buffer)
+    os.replace(temp_filename, filename)
 
     print("Done!!")
 
 
 def find_in_file(file, keyword):
-    column_names, column_size = parse_columns(file)
-    column_set = set(column_names)
-    if keyword in column_set:
-        return True
-    return False
+    # Collect the header block and find the column headings with one
+    # regex sweep instead of running the full parsing state machine
+    header_lines = []
+    for line in file:
+        if not line.strip():
+            # Blank lines occur inside these headers; skip them so the
+            # scan resumes after, as the other labview parsers do
+            continue
+        if not line.startswith("#"):
+            break
+        header_lines.append(line)
+
+    match = _COLUMN_HEADINGS_RE.search("".join(header_lines))
+    if match is None:
+        return False
+
+    heading = match.group(1).rstrip()
+    heading = heading.replace("*", " ")
+    heading = heading.replace("tempeXMAP4", "tempe        XMAP4")
+    heading = heading.replace("scatter_Sum XMAP4", "scatter_Sum        XMAP4")
+    heading = heading.replace("Stats1:TS20-", "Stats1:T        S20-")
+    heading = heading.replace("Mono Energy (alt)", "Mono Energy")
+    column_set = set(term.lstrip() for term in heading.split("  ") if term)
+    return keyword in column_set
 
 
 def find_unique_keywords():
@@ -573,46 +706,32 @@ def parse_element_name(filepath, df, metadata):
 
     element_name = None
     edge_symbol = None
-    if "Mono Energy" in set(df.keys()):
-        energy = df["Mono Energy"]
+    if "Mono Energy" in df.columns:
+        energy = df["Mono Energy"].to_numpy()
         if len(energy) > 1:
-            min_max = [min(energy), max(energy)]
+            energy_min = energy.min()
+            energy_max = energy.max()
 
             element_list = {}
             # Find if the edge value of an element in xrayDB is inside the range of
             # Mono Energy values of the current file
             # An element in XrayDB can contain more than one edge, each one identified by
-            # a unique IUPAC symbol
-            for current_element, values in _EDGE_ENERGY_DICT.items():
-                edges = values[1]
-                # Most of the cases are solved with a 'K' edge value. This is added to
-                # improve computing time
-                if "K" in edges:
-                    if (
-                        edges["K"].energy >= min_max[0]
-                        and edges["K"].energy <= min_max[1]
-                    ):
-                        element_list[current_element] = [
-                            values[0],
-                            current_element,
-                            "K",
-                            edges["K"].energy,
-                            False,
-                        ]
-                else:
-                    for key in edges:
-                        if (
-                            edges[key].energy >= min_max[0]
-                            and edges[key].energy <= min_max[1]
-                        ):
-                            element_list[current_element] = [
-                                values[0],
-                                current_element,
-                                key,
-                                edges[key].energy,
-                                False,
-                            ]
-                            break
+            # a unique IUPAC symbol. The range test runs as one broadcast over the
+            # flattened edge table; the first in-range edge of each element wins.
+            in_range = (_EDGE_FLAT_ENERGIES >= energy_min) & (
+                _EDGE_FLAT_ENERGIES <= energy_max
+            )
+            for flat_index in np.flatnonzero(in_range):
+                element_index, key, edge_energy = _EDGE_FLAT[flat_index]
+                current_element, number, _ = _EDGE_CANDIDATES[element_index]
+                if current_element not in element_list:
+                    element_list[current_element] = [
+                        number,
+                        current_element,
+                        key,
+                        edge_energy,
+                        False,
+                    ]
 
             # Find if the matching elements are named in the parsed metadata
             # Must considered cases with none or multiple matches